@@ -55,11 +55,26 @@ async def startup():
 
     :return: A coroutine, so you need to call it with asyncio
     """
-    r = await redis.Redis(host=config.REDIS_DOMAIN, port=config.REDIS_PORT, db=0, password=config.REDIS_PASSWORD,
-                          encoding="utf-8", decode_responses=True)
+    pool = redis.ConnectionPool(host=config.REDIS_DOMAIN, port=config.REDIS_PORT, db=0,
+                                password=config.REDIS_PASSWORD, encoding="utf-8", decode_responses=True,
+                                max_connections=config.REDIS_MAX_CONNECTIONS)
+    app.state.redis_pool = pool
+    r = redis.Redis(connection_pool=pool)
     await FastAPILimiter.init(r)
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    """
+    The shutdown function is called when the application shuts down.
+    It closes the connections of the Redis pool that was created in the startup function.
+
+    :return: A coroutine, so you need to call it with asyncio
+    """
+    await FastAPILimiter.close()
+    await app.state.redis_pool.disconnect()
+
+
 templates = Jinja2Templates(directory=BASE_DIR/"src"/"templates")
 
 
@@ -100,4 +115,5 @@ async def healthchecker(db: AsyncSession = Depends(get_db)):
 
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=int(os.environ.get("PORT", 8000)), log_level="info")
+    uvicorn.run("main:app", host="0.0.0.0", port=int(os.environ.get("PORT", 8000)), log_level="info",
+                loop="uvloop", http="httptools")
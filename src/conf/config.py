@@ -16,6 +16,7 @@ class Settings(BaseSettings):
     REDIS_DOMAIN: str = "localhost"
     REDIS_PORT: int = 6379
     REDIS_PASSWORD: str | None = None
+    REDIS_MAX_CONNECTIONS: int = 64
     CLOUDINARY_NAME: str = "cloudinary_name"
     CLOUDINARY_API_KEY: int = 0000000000000
     CLOUDINARY_API_SECRET: str = "cloudinary_api_secret"